@@ -0,0 +1,23 @@
+from typing import Union
+
+import numpy as np
+
+import math3d as m3d
+
+Matrix4 = Union[m3d.Matrix4f, m3d.Matrix4d]
+Vector4 = Union[m3d.Vector4f, m3d.Vector4d]
+
+# The delta used for tolerance (due to floating point precision mismatches)
+EPSILON = 1e-5
+
+
+def mat4_all_close(
+    mat: Matrix4, mat_np: np.ndarray, epsilon: float = EPSILON
+) -> bool:
+    return float(np.max(np.abs(np.asarray(mat) - mat_np))) <= epsilon
+
+
+def vec2_all_close(
+    vec: Vector4, vec_np: np.ndarray, epsilon: float = EPSILON
+) -> bool:
+    return float(np.max(np.abs(np.asarray(vec) - vec_np))) <= epsilon
@@ -0,0 +1,29 @@
+from typing import List
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--scale",
+        action="store_true",
+        default=False,
+        help="run also the slow tests that use large random sample sizes",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "slow: test uses large sample sizes (enable with --scale)"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    if config.getoption("--scale"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs the --scale option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
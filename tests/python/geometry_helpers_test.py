@@ -1,4 +1,4 @@
-from typing import Type, Union, cast
+from typing import Type, Union
 
 import numpy as np
 import pytest
@@ -22,7 +22,7 @@ EPSILON = 1e-5
 def vec3_all_close(
     vec: Vector3, vec_np: NDArray, epsilon: float = EPSILON
 ) -> bool:
-    return np.allclose(cast(NDArray, vec), vec_np, atol=epsilon)
+    return np.allclose(np.asarray(vec), vec_np, atol=epsilon)
 
 
 # Tests for Line type ----------------------------------------------------------
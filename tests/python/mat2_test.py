@@ -1,4 +1,4 @@
-from typing import Type, Union, cast
+from typing import Type, Union
 
 import numpy as np
 import pytest
@@ -22,13 +22,13 @@ EPSILON = 1e-5
 def mat2_all_close(
     mat: Matrix2, mat_np: np.ndarray, epsilon: float = EPSILON
 ) -> bool:
-    return np.allclose(cast(np.ndarray, mat), mat_np, atol=epsilon)
+    return np.allclose(np.asarray(mat), mat_np, atol=epsilon)
 
 
 def vec2_all_close(
     vec: Vector2, vec_np: np.ndarray, epsilon: float = EPSILON
 ) -> bool:
-    return np.allclose(cast(np.ndarray, vec), vec_np, atol=epsilon)
+    return np.allclose(np.asarray(vec), vec_np, atol=epsilon)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,48 @@
+from typing import Any, Dict, Tuple, Type, Union
+
+import numpy as np
+import pytest
+
+import math3d as m3d
+
+# Benchmarks are not collected with the tests (no *_test.py suffix). Run them
+# explicitly with `pytest tests/python/mat4_bench.py` (needs pytest-benchmark)
+pytest.importorskip("pytest_benchmark")
+
+Matrix4Cls = Type[Union[m3d.Matrix4f, m3d.Matrix4d]]
+
+Matrix4 = Union[m3d.Matrix4f, m3d.Matrix4d]
+
+# Make sure our generators are seeded with the answer to the universe :D
+RNG = np.random.default_rng(42)
+# Number of timed rounds, each one with freshly sampled operands
+NUM_ROUNDS = 1000
+# Number of untimed rounds used to warm up caches before measuring
+NUM_WARMUP_ROUNDS = 3
+
+
+@pytest.mark.parametrize(
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
+)
+def test_bench_matmul(
+    benchmark: Any, Mat4: Matrix4Cls, FloatType: type
+) -> None:
+    def setup() -> Tuple[Tuple[Matrix4, Matrix4], Dict[str, Any]]:
+        np_a, np_b = RNG.standard_normal((2, 4, 4), dtype=FloatType)
+        return (Mat4(np_a), Mat4(np_b)), {}
+
+    def matmul(mat_a: Matrix4, mat_b: Matrix4) -> Matrix4:
+        return mat_a * mat_b
+
+    # Only the product is timed, as the operands are created by setup(). Notice
+    # that pytest-benchmark requires a single iteration per round when using a
+    # setup function
+    mat_c = benchmark.pedantic(
+        matmul,
+        setup=setup,
+        rounds=NUM_ROUNDS,
+        warmup_rounds=NUM_WARMUP_ROUNDS,
+    )
+    assert type(mat_c) is Mat4
@@ -0,0 +1,145 @@
+from typing import Type, Union
+
+import numpy as np
+import pytest
+
+import math3d as m3d
+
+from ._helpers import mat4_all_close, vec2_all_close
+
+# Property-based checks are optional, as hypothesis is only a dev dependency
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, settings  # noqa: E402
+from hypothesis import strategies as st  # noqa: E402
+from hypothesis.extra import numpy as hnp  # noqa: E402
+
+Matrix4Cls = Type[Union[m3d.Matrix4f, m3d.Matrix4d]]
+Vector4Cls = Type[Union[m3d.Vector4f, m3d.Vector4d]]
+
+# Number of examples that hypothesis generates for each property
+NUM_EXAMPLES = 10
+
+
+def entries(dtype: type) -> st.SearchStrategy[float]:
+    # Entries are kept in [-1, 1] so that the rounding errors of the products
+    # stay well below the tolerance used by the comparison helpers
+    return st.floats(
+        -1.0,
+        1.0,
+        width=np.dtype(dtype).itemsize * 8,
+        allow_subnormal=False,
+    )
+
+
+def matrices(dtype: type) -> st.SearchStrategy[np.ndarray]:
+    return hnp.arrays(dtype, (4, 4), elements=entries(dtype))
+
+
+def vectors(dtype: type) -> st.SearchStrategy[np.ndarray]:
+    return hnp.arrays(dtype, (4,), elements=entries(dtype))
+
+
+@pytest.mark.parametrize(
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
+)
+@settings(max_examples=NUM_EXAMPLES, deadline=None)
+@given(data=st.data())
+def test_matrix_addition(
+    Mat4: Matrix4Cls, FloatType: type, data: st.DataObject
+) -> None:
+    np_a = data.draw(matrices(FloatType))
+    np_b = data.draw(matrices(FloatType))
+    mat_c = Mat4(np_a) + Mat4(np_b)
+    assert type(mat_c) is Mat4
+    assert mat4_all_close(mat_c, np_a + np_b)
+
+
+@pytest.mark.parametrize(
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
+)
+@settings(max_examples=NUM_EXAMPLES, deadline=None)
+@given(data=st.data())
+def test_matrix_substraction(
+    Mat4: Matrix4Cls, FloatType: type, data: st.DataObject
+) -> None:
+    np_a = data.draw(matrices(FloatType))
+    np_b = data.draw(matrices(FloatType))
+    mat_c = Mat4(np_a) - Mat4(np_b)
+    assert type(mat_c) is Mat4
+    assert mat4_all_close(mat_c, np_a - np_b)
+
+
+@pytest.mark.parametrize(
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
+)
+@settings(max_examples=NUM_EXAMPLES, deadline=None)
+@given(data=st.data())
+def test_matrix_scalar_product(
+    Mat4: Matrix4Cls, FloatType: type, data: st.DataObject
+) -> None:
+    np_mat = data.draw(matrices(FloatType))
+    factor = data.draw(entries(FloatType))
+    mat = Mat4(np_mat)
+    # Checking both __mul__ and __rmul__
+    assert mat4_all_close(mat * factor, np_mat * factor)
+    assert mat4_all_close(factor * mat, factor * np_mat)
+
+
+@pytest.mark.parametrize(
+    "Mat4, Vec4, FloatType",
+    [
+        (m3d.Matrix4f, m3d.Vector4f, np.float32),
+        (m3d.Matrix4d, m3d.Vector4d, np.float64),
+    ],
+    ids=["f32", "f64"],
+)
+@settings(max_examples=NUM_EXAMPLES, deadline=None)
+@given(data=st.data())
+def test_matrix_vector_product(
+    Mat4: Matrix4Cls, Vec4: Vector4Cls, FloatType: type, data: st.DataObject
+) -> None:
+    np_mat = data.draw(matrices(FloatType))
+    np_vec = data.draw(vectors(FloatType))
+    prod = Mat4(np_mat) * Vec4(np_vec)
+    assert type(prod) is Vec4
+    assert vec2_all_close(prod, np_mat @ np_vec)
+
+
+@pytest.mark.parametrize(
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
+)
+@settings(max_examples=NUM_EXAMPLES, deadline=None)
+@given(data=st.data())
+def test_matrix_matrix_product(
+    Mat4: Matrix4Cls, FloatType: type, data: st.DataObject
+) -> None:
+    np_a = data.draw(matrices(FloatType))
+    np_b = data.draw(matrices(FloatType))
+    mat_c = Mat4(np_a) * Mat4(np_b)
+    assert type(mat_c) is Mat4
+    assert mat4_all_close(mat_c, np_a @ np_b)
+
+
+@pytest.mark.parametrize(
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
+)
+@settings(max_examples=NUM_EXAMPLES, deadline=None)
+@given(data=st.data())
+def test_matrix_transpose(
+    Mat4: Matrix4Cls, FloatType: type, data: st.DataObject
+) -> None:
+    np_mat = data.draw(matrices(FloatType))
+    mat_t = Mat4(np_mat).transpose()
+    assert type(mat_t) is Mat4
+    assert mat4_all_close(mat_t, np_mat.T)
@@ -1,38 +1,113 @@
-from typing import Type, Union, cast
+from typing import Dict, Tuple, Type, Union
 
 import numpy as np
 import pytest
 
 import math3d as m3d
 
+from ._helpers import EPSILON, mat4_all_close, vec2_all_close
+
 Matrix4Cls = Type[Union[m3d.Matrix4f, m3d.Matrix4d]]
 Vector4Cls = Type[Union[m3d.Vector4f, m3d.Vector4d]]
 
 Matrix4 = Union[m3d.Matrix4f, m3d.Matrix4d]
-Vector4 = Union[m3d.Vector4f, m3d.Vector4d]
 
 # Make sure our generators are seeded with the answer to the universe :D
-np.random.seed(42)
+SEED = 42
 # Number of times we will sample a random matrix for mat4 operator checks
 NUM_RANDOM_SAMPLES = 10
-# The delta used for tolerance (due to floating point precision mismatches)
-EPSILON = 1e-5
+# Sample sizes for the operator checks. The larger ones are used to expose the
+# steady-state throughput of the bindings, so they're marked as slow (these run
+# only when the --scale option is given)
+SAMPLE_SIZES = [
+    NUM_RANDOM_SAMPLES,
+    pytest.param(1_000, marks=pytest.mark.slow),
+    pytest.param(100_000, marks=pytest.mark.slow),
+]
+# Alignment (in bytes) of the buffers backing the random sample pools
+POOL_ALIGNMENT = 64
+# Largest condition number of the samples used for determinant/inverse checks
+MAX_CONDITION_NUMBER = 100.0
+
+
+def aligned_empty(
+    shape: Tuple[int, ...], dtype: type, alignment: int = POOL_ALIGNMENT
+) -> np.ndarray:
+    # Over-allocate a raw byte buffer, and return a C-contiguous view into it
+    # whose first element starts at an address multiple of the alignment
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    buffer = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -buffer.ctypes.data % alignment
+    end = offset + nbytes
+    return buffer[offset:end].view(dtype).reshape(shape)
+
+
+def well_conditioned(np_mats: np.ndarray) -> np.ndarray:
+    # Keep only the samples whose condition number is below the threshold, as
+    # the single precision inverse and determinant of an ill-conditioned matrix
+    # drift away from the numpy reference by more than our tolerance
+    np_mats = np_mats[np.linalg.cond(np_mats) < MAX_CONDITION_NUMBER]
+    assert len(np_mats) > 0
+    return np_mats
+
+
+@pytest.fixture(scope="module")
+def canonical_mats() -> Dict[Matrix4Cls, Matrix4]:
+    # Matrices with entries 1 to 16 (row-major), built only once per module and
+    # shared by the tests that don't modify them
+    # fmt: off
+    return {
+        Mat4: Mat4(1.0,  2.0,  3.0,  4.0,
+                   5.0,  6.0,  7.0,  8.0,
+                   9.0, 10.0, 11.0, 12.0,
+                   13.0, 14.0, 15.0, 16.0)
+        for Mat4 in (m3d.Matrix4f, m3d.Matrix4d)
+    }
+    # fmt: on
+
+
+@pytest.fixture(scope="module")
+def num_samples(request: pytest.FixtureRequest) -> int:
+    # Tests can scale this up by indirectly parametrizing it with SAMPLE_SIZES
+    return getattr(request, "param", NUM_RANDOM_SAMPLES)
+
 
+@pytest.fixture(scope="module")
+def rand_pools(num_samples: int) -> Dict[type, np.ndarray]:
+    # Pairs of random matrices of shape (num_samples, 2, 4, 4) shared by all
+    # tests. We draw them only once in double precision, and cast them only
+    # once for the single precision tests. Notice that the numpy constructor
+    # of MatrixN reads the buffer assuming row-major contiguous storage (it
+    # ignores strides), so the pools must be C-contiguous. Their buffers are
+    # also aligned, so each 4x4 sample (64 or 128 bytes) starts at a 64-byte
+    # boundary. Each pool gets its own generator, so its samples don't depend
+    # on which tests (and pool sizes) ran before
+    rng = np.random.default_rng((SEED, num_samples))
+    pool64 = aligned_empty((num_samples, 2, 4, 4), np.float64)
+    rng.standard_normal(out=pool64)
+    pool32 = aligned_empty((num_samples, 2, 4, 4), np.float32)
+    pool32[...] = pool64
+    return {np.float32: pool32, np.float64: pool64}
 
-def mat4_all_close(
-    mat: Matrix4, mat_np: np.ndarray, epsilon: float = EPSILON
-) -> bool:
-    return np.allclose(cast(np.ndarray, mat), mat_np, atol=epsilon)
 
+@pytest.fixture
+def rng() -> np.random.Generator:
+    # Fresh generator for the samples drawn inside a test (e.g. scalars or
+    # vectors), so these don't depend on which tests ran before
+    return np.random.default_rng(SEED)
 
-def vec2_all_close(
-    vec: Vector4, vec_np: np.ndarray, epsilon: float = EPSILON
-) -> bool:
-    return np.allclose(cast(np.ndarray, vec), vec_np, atol=epsilon)
+
+@pytest.fixture
+def rand_pool(
+    FloatType: type, rand_pools: Dict[type, np.ndarray]
+) -> np.ndarray:
+    return rand_pools[FloatType]
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
 def test_default_constructor(Mat4: Matrix4Cls, FloatType: type) -> None:
     mat = Mat4()
@@ -41,16 +116,20 @@ def test_default_constructor(Mat4: Matrix4Cls, FloatType: type) -> None:
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
 def test_diagonal_constructor(Mat4: Matrix4Cls, FloatType: type) -> None:
     mat = Mat4(1.0, 2.0, 3.0, 4.0)
-    expected_np = np.diag([1.0, 2.0, 3.0, 4.0]).astype(FloatType)
+    expected_np = np.diag(np.array([1.0, 2.0, 3.0, 4.0], dtype=FloatType))
     assert mat4_all_close(mat, expected_np)
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
 def test_all_entries_constructor(Mat4: Matrix4Cls, FloatType: type) -> None:
     # fmt: off
@@ -72,6 +151,7 @@ def test_all_entries_constructor(Mat4: Matrix4Cls, FloatType: type) -> None:
         (m3d.Matrix4f, m3d.Vector4f, np.float32),
         (m3d.Matrix4d, m3d.Vector4d, np.float64),
     ],
+    ids=["f32", "f64"],
 )
 def test_columns_constructor(
     Mat4: Matrix4Cls, Vec4: Vector4Cls, FloatType: type
@@ -91,7 +171,9 @@ def test_columns_constructor(
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
 def test_numpy_array_constructor(Mat4: Matrix4Cls, FloatType: type) -> None:
     # fmt: off
@@ -107,22 +189,45 @@ def test_numpy_array_constructor(Mat4: Matrix4Cls, FloatType: type) -> None:
     assert mat4_all_close(mat, expected_np)
 
 
+@pytest.mark.parametrize(
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
+)
+def test_storage_is_column_major(
+    Mat4: Matrix4Cls,
+    FloatType: type,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+) -> None:
+    mat = canonical_mats[Mat4]
+
+    # The buffer exposed by the bindings is the storage of the matrix itself,
+    # which must be column-major (each column is contiguous in memory)
+    view = memoryview(mat)
+    assert view.f_contiguous and not view.c_contiguous
+
+    # Walking the buffer in memory order should give column 0 first, then 1,...
+    mat_np = np.asarray(mat)
+    expected_storage = np.arange(1.0, 17.0, dtype=FloatType).reshape(4, 4).T
+    assert mat_np.dtype == FloatType
+    assert np.array_equal(mat_np.ravel(order="K"), expected_storage.ravel())
+
+
 @pytest.mark.parametrize(
     "Mat4, Vec4, FloatType",
     [
         (m3d.Matrix4f, m3d.Vector4f, np.float32),
         (m3d.Matrix4d, m3d.Vector4d, np.float64),
     ],
+    ids=["f32", "f64"],
 )
 def test_get_column(
-    Mat4: Matrix4Cls, Vec4: Vector4Cls, FloatType: type
+    Mat4: Matrix4Cls,
+    Vec4: Vector4Cls,
+    FloatType: type,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
 ) -> None:
-    # fmt: off
-    mat = Mat4(1.0,  2.0,  3.0,  4.0,
-               5.0,  6.0,  7.0,  8.0,
-               9.0, 10.0, 11.0, 12.0,
-               13.0, 14.0, 15.0, 16.0)
-    # fmt: on
+    mat = canonical_mats[Mat4]
 
     # __getitem__ by using a single entry should return the requested column
     col0, col1, col2, col3 = mat[0], mat[1], mat[2], mat[3]
@@ -132,28 +237,22 @@ def test_get_column(
         and type(col2) is Vec4
         and type(col3) is Vec4
     )
-    assert vec2_all_close(
-        col0, np.array([1.0, 5.0, 9.0, 13.0], dtype=FloatType)
-    )
-    assert vec2_all_close(
-        col1, np.array([2.0, 6.0, 10.0, 14.0], dtype=FloatType)
-    )
-    assert vec2_all_close(
-        col2, np.array([3.0, 7.0, 11.0, 15.0], dtype=FloatType)
-    )
-    assert vec2_all_close(
-        col3, np.array([4.0, 8.0, 12.0, 16.0], dtype=FloatType)
-    )
 
+    # The rows of the transpose are views into the expected columns
+    expected_cols = np.arange(1.0, 17.0, dtype=FloatType).reshape(4, 4).T
+    assert vec2_all_close(col0, expected_cols[0])
+    assert vec2_all_close(col1, expected_cols[1])
+    assert vec2_all_close(col2, expected_cols[2])
+    assert vec2_all_close(col3, expected_cols[3])
 
-@pytest.mark.parametrize("Mat4", [(m3d.Matrix4f), (m3d.Matrix4d)])
-def test_get_entry(Mat4: Matrix4Cls) -> None:
-    # fmt: off
-    mat = Mat4(1.0,  2.0,  3.0,  4.0,
-               5.0,  6.0,  7.0,  8.0,
-               9.0, 10.0, 11.0, 12.0,
-               13.0, 14.0, 15.0, 16.0)
-    # fmt: on
+
+@pytest.mark.parametrize(
+    "Mat4", [(m3d.Matrix4f), (m3d.Matrix4d)], ids=["f32", "f64"]
+)
+def test_get_entry(
+    Mat4: Matrix4Cls, canonical_mats: Dict[Matrix4Cls, Matrix4]
+) -> None:
+    mat = canonical_mats[Mat4]
 
     # __getitem__ by using a tuple to get matrix entries
     assert (
@@ -183,7 +282,9 @@ def test_get_entry(Mat4: Matrix4Cls) -> None:
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
 def test_set_column(Mat4: Matrix4Cls, FloatType: type) -> None:
     # fmt: off
@@ -206,7 +307,9 @@ def test_set_column(Mat4: Matrix4Cls, FloatType: type) -> None:
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
 def test_set_entry(Mat4: Matrix4Cls, FloatType: type) -> None:
     # fmt: off
@@ -229,7 +332,9 @@ def test_set_entry(Mat4: Matrix4Cls, FloatType: type) -> None:
     assert mat4_all_close(mat, expected_np)
 
 
-@pytest.mark.parametrize("Mat4", [(m3d.Matrix4f), (m3d.Matrix4d)])
+@pytest.mark.parametrize(
+    "Mat4", [(m3d.Matrix4f), (m3d.Matrix4d)], ids=["f32", "f64"]
+)
 def test_comparison_operator(Mat4: Matrix4Cls) -> None:
     # fmt: off
     mat_a = Mat4(1.0,  2.0,  3.0,  4.0,
@@ -252,16 +357,22 @@ def test_comparison_operator(Mat4: Matrix4Cls) -> None:
     assert mat_a != mat_b
 
 
+@pytest.mark.parametrize("num_samples", SAMPLE_SIZES, indirect=True)
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_addition(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_addition(
+    Mat4: Matrix4Cls,
+    FloatType: type,
+    rand_pool: np.ndarray,
+    num_samples: int,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+) -> None:
     # Testing against some hard-coded matrices
     # fmt: off
-    mat_a = Mat4(1.0,  2.0,  3.0,  4.0,
-                 5.0,  6.0,  7.0,  8.0,
-                 9.0, 10.0, 11.0, 12.0,
-                 13.0, 14.0, 15.0, 16.0)
+    mat_a = canonical_mats[Mat4]
     mat_b = Mat4(2.0,  3.0,  5.0,  7.0,
                  11.0, 13.0, 17.0, 19.0,
                  23.0, 29.0, 31.0, 37.0,
@@ -276,27 +387,35 @@ def test_matrix_addition(Mat4: Matrix4Cls, FloatType: type) -> None:
     assert mat_c == expected_c
 
     # Testing against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_a = np.random.randn(4, 4).astype(FloatType)
-        np_b = np.random.randn(4, 4).astype(FloatType)
-        np_c = np_a + np_b
-
-        mat_a, mat_b = Mat4(np_a), Mat4(np_b)
-        mat_c = mat_a + mat_b
-        # Check that we're doing what numpy does for addition
-        assert mat4_all_close(mat_c, np_c)
-
-
+    np_mats_a, np_mats_b = rand_pool[:, 0], rand_pool[:, 1]
+    mats_a = [Mat4(np_a) for np_a in np_mats_a]
+    mats_b = [Mat4(np_b) for np_b in np_mats_b]
+    # The bindings expose the buffer protocol, so each result is copied straight
+    # into the preallocated batch without wrapping it in a new ndarray first
+    results = np.empty((num_samples, 4, 4), dtype=FloatType)
+    for i in range(num_samples):
+        results[i] = mats_a[i] + mats_b[i]
+    expected = np_mats_a + np_mats_b
+    # Check that we're doing what numpy does for addition
+    assert np.allclose(results, expected, atol=EPSILON)
+
+
+@pytest.mark.parametrize("num_samples", SAMPLE_SIZES, indirect=True)
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_substraction(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_substraction(
+    Mat4: Matrix4Cls,
+    FloatType: type,
+    rand_pool: np.ndarray,
+    num_samples: int,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+) -> None:
     # Testing against some hard-coded matrices
     # fmt: off
-    mat_a = Mat4(1.0,  2.0,  3.0,  4.0,
-                 5.0,  6.0,  7.0,  8.0,
-                 9.0, 10.0, 11.0, 12.0,
-                 13.0, 14.0, 15.0, 16.0)
+    mat_a = canonical_mats[Mat4]
     mat_b = Mat4(2.0,  3.0,  5.0,  7.0,
                  11.0, 13.0, 17.0, 19.0,
                  23.0, 29.0, 31.0, 37.0,
@@ -311,27 +430,34 @@ def test_matrix_substraction(Mat4: Matrix4Cls, FloatType: type) -> None:
     assert mat_c == expected_c
 
     # Testing against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_a = np.random.randn(4, 4).astype(FloatType)
-        np_b = np.random.randn(4, 4).astype(FloatType)
-        np_c = np_a - np_b
-
-        mat_a, mat_b = Mat4(np_a), Mat4(np_b)
-        mat_c = mat_a - mat_b
-        # Check that we're doing what numpy does for addition
-        assert mat4_all_close(mat_c, np_c)
-
-
+    np_mats_a, np_mats_b = rand_pool[:, 0], rand_pool[:, 1]
+    mats_a = [Mat4(np_a) for np_a in np_mats_a]
+    mats_b = [Mat4(np_b) for np_b in np_mats_b]
+    results = np.empty((num_samples, 4, 4), dtype=FloatType)
+    for i in range(num_samples):
+        results[i] = mats_a[i] - mats_b[i]
+    expected = np_mats_a - np_mats_b
+    # Check that we're doing what numpy does for addition
+    assert np.allclose(results, expected, atol=EPSILON)
+
+
+@pytest.mark.parametrize("num_samples", SAMPLE_SIZES, indirect=True)
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_scalar_product(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_scalar_product(
+    Mat4: Matrix4Cls,
+    FloatType: type,
+    rand_pool: np.ndarray,
+    num_samples: int,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+    rng: np.random.Generator,
+) -> None:
     # Checking against hard-coded test case
     # fmt: off
-    mat = Mat4(1.0,  2.0,  3.0,  4.0,
-               5.0,  6.0,  7.0,  8.0,
-               9.0, 10.0, 11.0, 12.0,
-               13.0, 14.0, 15.0, 16.0)
+    mat = canonical_mats[Mat4]
     factor = 1.5
     expected_scaled = Mat4(1.5,  3.0,  4.5,  6.0,
                            7.5,  9.0, 10.5, 12.0,
@@ -346,43 +472,46 @@ def test_matrix_scalar_product(Mat4: Matrix4Cls, FloatType: type) -> None:
 
     # Checking __rmul__
     scaled = factor * mat
-    assert type(scaled) == Mat4
+    assert type(scaled) is Mat4
     assert scaled == expected_scaled
 
     # Checking against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_mat = np.random.randn(4, 4).astype(FloatType)
-        factor = np.random.randn()
-        mat = Mat4(np_mat)
-
+    np_mats = rand_pool[:, 0]
+    mats = [Mat4(np_mat) for np_mat in np_mats]
+    factors = rng.standard_normal(num_samples).tolist()
+    results = np.empty((num_samples, 2, 4, 4), dtype=FloatType)
+    expected = np.empty_like(results)
+    for i, (mat, np_mat, factor) in enumerate(zip(mats, np_mats, factors)):
         # Checking __mul__
-        scaled = mat * factor
-        np_scaled = np_mat * factor
-        assert mat4_all_close(scaled, np_scaled)
+        results[i, 0] = mat * factor
+        expected[i, 0] = np_mat * factor
 
         # Checking __rmul__
-        scaled = factor * mat
-        np_scaled = factor * np_mat
-        assert mat4_all_close(scaled, np_scaled)
+        results[i, 1] = factor * mat
+        expected[i, 1] = factor * np_mat
+    assert np.allclose(results, expected, atol=EPSILON)
 
 
+@pytest.mark.parametrize("num_samples", SAMPLE_SIZES, indirect=True)
 @pytest.mark.parametrize(
     "Mat4, Vec4, FloatType",
     [
         (m3d.Matrix4f, m3d.Vector4f, np.float32),
         (m3d.Matrix4d, m3d.Vector4d, np.float64),
     ],
+    ids=["f32", "f64"],
 )
 def test_matrix_vector_product(
-    Mat4: Matrix4Cls, Vec4: Vector4Cls, FloatType: type
+    Mat4: Matrix4Cls,
+    Vec4: Vector4Cls,
+    FloatType: type,
+    rand_pool: np.ndarray,
+    num_samples: int,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+    rng: np.random.Generator,
 ) -> None:
     # Checking against hard-coded test case
-    # fmt: off
-    mat = Mat4(1.0,  2.0,  3.0,  4.0,
-               5.0,  6.0,  7.0,  8.0,
-               9.0, 10.0, 11.0, 12.0,
-               13.0, 14.0, 15.0, 16.0)
-    # fmt: on
+    mat = canonical_mats[Mat4]
     vec = Vec4(1.0, 2.0, 3.0, 4.0)
     prod = mat * vec
     expected_prod = Vec4(30.0, 70.0, 110.0, 150.0)
@@ -390,27 +519,34 @@ def test_matrix_vector_product(
     assert prod == expected_prod
 
     # Checking against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_mat = np.random.randn(4, 4).astype(FloatType)
-        np_vec = np.random.randn(4, 1).astype(FloatType)
-        mat = Mat4(np_mat)
-        vec = Vec4(np_vec)
-
-        np_prod = np_mat @ vec
-        prod = mat * vec
-        assert vec2_all_close(prod, np_prod)
-
-
+    np_mats = rand_pool[:, 0]
+    np_vecs = rng.standard_normal((num_samples, 4, 1), dtype=FloatType)
+    mats = [Mat4(np_mat) for np_mat in np_mats]
+    vecs = [Vec4(np_vec) for np_vec in np_vecs]
+    results = np.empty((num_samples, 4), dtype=FloatType)
+    for i, (mat, vec) in enumerate(zip(mats, vecs)):
+        results[i] = mat * vec
+    # Compute all reference products in a single batched call
+    expected = np.matmul(np_mats, np_vecs)[:, :, 0]
+    assert np.allclose(results, expected, atol=EPSILON)
+
+
+@pytest.mark.parametrize("num_samples", SAMPLE_SIZES, indirect=True)
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_matrix_product(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_matrix_product(
+    Mat4: Matrix4Cls,
+    FloatType: type,
+    rand_pool: np.ndarray,
+    num_samples: int,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+) -> None:
     # Checking against hard-coded test case
     # fmt: off
-    mat_a = Mat4(1.0,  2.0,  3.0,  4.0,
-                 5.0,  6.0,  7.0,  8.0,
-                 9.0, 10.0, 11.0, 12.0,
-                 13.0, 14.0, 15.0, 16.0)
+    mat_a = canonical_mats[Mat4]
     mat_b = Mat4(2.0,  3.0,  5.0,  7.0,
                  11.0, 13.0, 17.0, 19.0,
                  23.0, 29.0, 31.0, 37.0,
@@ -421,79 +557,88 @@ def test_matrix_matrix_product(Mat4: Matrix4Cls, FloatType: type) -> None:
                       1181., 1344., 1520., 1760)
     mat_c = mat_a * mat_b
     # fmt: on
-    assert type(mat_c) == Mat4
+    assert type(mat_c) is Mat4
     assert mat_c == expected_c
 
     # Checking against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_mat_a = np.random.randn(4, 4).astype(FloatType)
-        np_mat_b = np.random.randn(4, 4).astype(FloatType)
-        mat_a, mat_b = Mat4(np_mat_a), Mat4(np_mat_b)
-
-        mat_c = mat_a * mat_b
-        expected_c = np_mat_a @ np_mat_b
-        assert mat4_all_close(mat_c, expected_c)
+    np_mats_a, np_mats_b = rand_pool[:, 0], rand_pool[:, 1]
+    mats_a = [Mat4(np_a) for np_a in np_mats_a]
+    mats_b = [Mat4(np_b) for np_b in np_mats_b]
+    results = np.empty((num_samples, 4, 4), dtype=FloatType)
+    for i in range(num_samples):
+        results[i] = mats_a[i] * mats_b[i]
+    # Compute all reference products in a single batched call
+    expected = np.matmul(np_mats_a, np_mats_b)
+    assert np.allclose(results, expected, atol=EPSILON)
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_transpose(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_transpose(
+    Mat4: Matrix4Cls,
+    FloatType: type,
+    rand_pool: np.ndarray,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+) -> None:
     # Checking against a hard-coded test case
     # fmt: off
-    mat = Mat4(1.0,  2.0,  3.0,  4.0,
-               5.0,  6.0,  7.0,  8.0,
-               9.0, 10.0, 11.0, 12.0,
-               13.0, 14.0, 15.0, 16.0)
+    mat = canonical_mats[Mat4]
     expected_mat = Mat4(1.0, 5.0,  9.0, 13.0,
                         2.0, 6.0, 10.0, 14.0,
                         3.0, 7.0, 11.0, 15.0,
                         4.0, 8.0, 12.0, 16.0)
     # fmt: on
     mat_t = mat.transpose()
-    assert type(mat_t) == Mat4
+    assert type(mat_t) is Mat4
     assert mat_t == expected_mat
 
     # Checking against a randomly sampled matrix
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_mat = np.random.randn(4, 4).astype(FloatType)
-        mat = Mat4(np_mat)
-
+    np_mats = rand_pool[:, 0]
+    mats = [Mat4(np_mat) for np_mat in np_mats]
+    for mat, np_mat in zip(mats, np_mats):
         mat_t = mat.transpose()
         expected_np_mat_t = np_mat.T
         assert mat4_all_close(mat_t, expected_np_mat_t)
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_trace(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_trace(
+    Mat4: Matrix4Cls,
+    FloatType: type,
+    rand_pool: np.ndarray,
+    canonical_mats: Dict[Matrix4Cls, Matrix4],
+) -> None:
     # Checking against a hard-coded test case
-    # fmt: off
-    mat = Mat4(1.0,  2.0,  3.0,  4.0,
-               5.0,  6.0,  7.0,  8.0,
-               9.0, 10.0, 11.0, 12.0,
-               13.0, 14.0, 15.0, 16.0)
-    # fmt: on
+    mat = canonical_mats[Mat4]
     trace = mat.trace()
     expected_trace = 34.0
     assert type(trace) is float
     assert np.abs(trace - expected_trace) < EPSILON
 
     # Checking against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_mat = np.random.randn(4, 4).astype(FloatType)
-        mat = Mat4(np_mat)
-
+    np_mats = rand_pool[:, 0]
+    mats = [Mat4(np_mat) for np_mat in np_mats]
+    for mat, np_mat in zip(mats, np_mats):
         trace = mat.trace()
         expected_trace = np.trace(np_mat)
         assert np.abs(trace - expected_trace) < EPSILON
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_determinant(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_determinant(
+    Mat4: Matrix4Cls, FloatType: type, rand_pool: np.ndarray
+) -> None:
     # Checking against a hard-coded test case
     # fmt: off
     mat = Mat4(0.91464976,  0.55413345,  0.19333044, -0.60001319,
@@ -507,19 +652,22 @@ def test_matrix_determinant(Mat4: Matrix4Cls, FloatType: type) -> None:
     assert np.abs(det - expected_det) < EPSILON
 
     # Checking against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_mat = np.random.randn(4, 4).astype(FloatType)
-        mat = Mat4(np_mat)
-
+    np_mats = well_conditioned(rand_pool[:, 0])
+    mats = [Mat4(np_mat) for np_mat in np_mats]
+    for mat, np_mat in zip(mats, np_mats):
         det = mat.determinant()
         expected_det = np.linalg.det(np_mat)
         assert np.abs(det - expected_det) < EPSILON
 
 
 @pytest.mark.parametrize(
-    "Mat4, FloatType", [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)]
+    "Mat4, FloatType",
+    [(m3d.Matrix4f, np.float32), (m3d.Matrix4d, np.float64)],
+    ids=["f32", "f64"],
 )
-def test_matrix_inverse(Mat4: Matrix4Cls, FloatType: type) -> None:
+def test_matrix_inverse(
+    Mat4: Matrix4Cls, FloatType: type, rand_pool: np.ndarray
+) -> None:
     # Checking against a hard-coded test case
     # fmt: off
     mat = Mat4(0.91464976,  0.55413345,  0.19333044, -0.60001319,
@@ -536,10 +684,12 @@ def test_matrix_inverse(Mat4: Matrix4Cls, FloatType: type) -> None:
     assert inv == expected_inv
 
     # Checking against some randomly sampled matrices
-    for _ in range(NUM_RANDOM_SAMPLES):
-        np_mat = np.random.randn(4, 4).astype(FloatType)
-        mat = Mat4(np_mat)
-
+    np_mats = well_conditioned(rand_pool[:, 0])
+    mats = [Mat4(np_mat) for np_mat in np_mats]
+    for mat, np_mat in zip(mats, np_mats):
         inv = mat.inverse()
         expected_inv = np.linalg.inv(np_mat)
-        assert mat4_all_close(inv, expected_inv)
+        # The rounding error of the inverse scales with the magnitude of its
+        # entries, which can be larger than 1 even for well-conditioned
+        # samples, so keep the relative tolerance of np.allclose here
+        assert np.allclose(inv, expected_inv, atol=EPSILON)